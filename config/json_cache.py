@@ -0,0 +1,192 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+
+
+def write_json_atomic(path, text):
+    """
+    Writes the text to a temporary file next to the target file, which then replaces it,
+    so an interrupted write cannot leave a truncated file behind. The permissions of the replaced file are kept.
+
+    :param path: Path to the JSON file.
+    :param text: The serialized JSON.
+    :return: None
+    """
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path) or '.', suffix='.tmp',
+                                     delete=False) as temp_file:
+        temp_file.write(text)
+    try:
+        shutil.copymode(path, temp_file.name)
+    except FileNotFoundError:
+        pass
+    os.replace(temp_file.name, path)
+
+
+class JsonCache:
+    """
+    Parsed JSON files shared by all pages of the application, keyed by the file path.
+
+    A file is parsed again only if its modification time or size changed since it was cached, so pages that read
+    the same file do not open it every time. Pages that write a cached file hand the written data back
+    with `put`, or let the cache write it in the background with `save`.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty cache and the background writer. A single writer thread keeps the writes
+        to a file in the order they were saved.
+        """
+        self._entries = {}  # Path -> [(st_mtime_ns, st_size), data or None, pickled data or None]
+        self._pending = {}  # Path -> number of background writes not finished yet
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.on_write_error = None  # Called with (path, error) in the writer thread when a background write fails
+
+    def get(self, path, copy=False):
+        """
+        Returns the parsed data of the JSON file, reading the file only if it changed since it was cached.
+        While a background write of the file is pending, the cached data is the latest and is returned as is.
+
+        By default the returned data is shared, changes to it must be saved to the file and handed back
+        with `put` or `save`. With `copy`, the caller gets its own copy to change freely. The copy is unpickled
+        from a snapshot, which is faster than reading the file again, while copy.deepcopy is slower than both.
+
+        :param path: Path to the JSON file.
+        :param copy: Whether to return a copy of the data instead of the shared data.
+        :return: The parsed JSON data.
+        :raises FileNotFoundError: If the file does not exist.
+        :raises json.JSONDecodeError: If the file is not valid JSON.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            pending = self._pending.get(path)
+
+        # A cached entry is the latest data while writes are pending, without one the file is read
+        if entry is None or not pending:
+            stat = os.stat(path)
+            if entry is None or entry[0] != (stat.st_mtime_ns, stat.st_size):
+                with open(path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                if copy:
+                    # The parsed data goes to the caller, the cache keeps only its snapshot
+                    entry = [(stat.st_mtime_ns, stat.st_size), None, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)]
+                else:
+                    entry = [(stat.st_mtime_ns, stat.st_size), data, None]
+                with self._lock:
+                    if not self._pending.get(path):
+                        self._entries[path] = entry
+                if copy:
+                    return data
+
+        if not copy:
+            if entry[1] is None:
+                entry[1] = pickle.loads(entry[2])
+            return entry[1]
+        if entry[2] is None:
+            entry[2] = pickle.dumps(entry[1], pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(entry[2])
+
+    def put(self, path, data):
+        """
+        Stores the data as the content of the JSON file at its current modification time.
+        Called after the data was written to the file.
+
+        :param path: Path to the JSON file.
+        :param data: The data the file holds.
+        :return: None
+        """
+        snapshot = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            try:
+                stat = os.stat(path)
+                self._entries[path] = [(stat.st_mtime_ns, stat.st_size), data, snapshot]
+            except FileNotFoundError:
+                self._entries.pop(path, None)
+
+    def save(self, path, data, **dump_kwargs):
+        """
+        Stores the data in the cache right away and writes it to the JSON file in the background,
+        so the caller does not wait for the disk. The data is serialized before returning,
+        so it can be changed again while the write is pending.
+
+        If the write fails, the error is reported and, unless a later write is pending, the cached data is dropped,
+        so the next `get` reads the file.
+
+        :param path: Path to the JSON file.
+        :param data: The data to save.
+        :param dump_kwargs: Keyword arguments for `json.dumps`.
+        :return: The future of the background write.
+        """
+        text = json.dumps(data, **dump_kwargs)
+        snapshot = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._entries[path] = [None, data, snapshot]
+            self._pending[path] = self._pending.get(path, 0) + 1
+
+        future = self._executor.submit(write_json_atomic, path, text)
+        future.add_done_callback(lambda f: self._write_done(path, f))
+        return future
+
+    def _write_done(self, path, future):
+        """
+        Called in the writer thread when a background write finished. Once the last pending write of the file
+        is done, the cached data is stored with the new modification time and size of the file.
+        A failed write is printed and passed to `on_write_error`. If it was the last pending write,
+        the cached data is dropped, as the file does not hold it. A later write saves the whole data again.
+
+        :param path: Path to the JSON file.
+        :param future: The future of the finished write.
+        :return: None
+        """
+        error = future.exception()
+        if error is not None:
+            print(f"Error saving {path}: {error}")
+            if self.on_write_error is not None:
+                self.on_write_error(path, error)
+
+        with self._lock:
+            self._pending[path] -= 1
+            if self._pending[path]:
+                return
+            del self._pending[path]
+
+            if error is not None:
+                self._entries.pop(path, None)
+            elif path in self._entries:
+                try:
+                    stat = os.stat(path)
+                    self._entries[path][0] = (stat.st_mtime_ns, stat.st_size)
+                except FileNotFoundError:
+                    self._entries.pop(path, None)
+
+    def wait_for_writes(self, path):
+        """
+        Blocks until the background writes of the JSON file are done. Called before the file is read,
+        written, renamed or removed without the cache, so an older background write cannot land afterwards.
+
+        :param path: Path to the JSON file.
+        :return: None
+        """
+        with self._lock:
+            pending = self._pending.get(path)
+        if pending:
+            self._executor.submit(int).result()  # The writes run in order, this returns once they are done
+
+    def invalidate(self, path):
+        """
+        Drops the cached data of the JSON file, the next `get` reads the file again.
+
+        :param path: Path to the JSON file.
+        :return: None
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+
+# The cache of the application, shared by the pages and by `load_tasks_from_json`
+json_cache = JsonCache()
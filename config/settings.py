@@ -203,6 +203,7 @@ YEARLY_PLANS = {
     'pin_label_bg': "#E0E0D8",
     'pin_icon_path': "./assets/yearly_plans/pin_icon.png",
     'smile_icon_path': "./assets/yearly_plans/cool_face_icon.png",
+    'pin_icon_size': (24, 24),
     'pin_frame_font': ("Arial", 12),
     'pin_frame_text_color': "#333333",
     'add_button_color': "#90EE90",
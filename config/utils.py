@@ -3,7 +3,32 @@ from tkinter import Frame, Label
 from PIL import Image, ImageTk
 import webbrowser
 import json
+import functools
 from config.settings import INTERFACE, USEFUL_LINKS
+from config.json_cache import json_cache
+
+# Decoded icons shared by all pages, keyed by (path, size). Holding them here also keeps Tk from discarding them
+_ICON_CACHE = {}
+
+
+def get_icon_image(icon_path, icon_size=None):
+    """
+    Returns the icon as a PhotoImage, decoding and resizing the file only the first time it is requested.
+    Must be called after the Tk root window has been created.
+
+    :param icon_path: The file path to the icon image.
+    :param icon_size: Optional (width, height) to resize the icon to.
+    :return: ImageTk.PhotoImage
+    """
+    key = (icon_path, icon_size)
+    icon_photo = _ICON_CACHE.get(key)
+    if icon_photo is None:
+        with Image.open(icon_path) as icon_image:
+            if icon_size:
+                icon_image = icon_image.resize(icon_size, Image.Resampling.LANCZOS)
+            icon_photo = ImageTk.PhotoImage(icon_image)
+        _ICON_CACHE[key] = icon_photo
+    return icon_photo
 
 
 def add_source_label(parent, link, title, bg_color, font):
@@ -39,6 +64,20 @@ def add_source_label(parent, link, title, bg_color, font):
     source_label.pack(side="left", padx=(5, 0))
 
 
+@functools.lru_cache(maxsize=4)
+def load_banner_image(banner_path):
+    """
+    Decodes the banner image, keeping the last few banners so that going back and forth between pages
+    does not decode them again. A decoded banner takes about 12 MB, hence the small cache size.
+    The returned image is shared and must not be modified, resizing it returns a new image.
+
+    :param banner_path: The file path to the banner image.
+    :return: The decoded PIL image.
+    """
+    with Image.open(banner_path) as img:
+        return img.copy()
+
+
 def add_banner(parent, banner_path, bg_color, fixed_height=200, padding=(2, 10)):
     """
     Adds a banner to the parent widget. The banner is an image that is loaded from the
@@ -55,8 +94,7 @@ def add_banner(parent, banner_path, bg_color, fixed_height=200, padding=(2, 10))
              If there is an error loading the image, returns (None, None).
     """
     try:
-        with Image.open(banner_path) as img:
-            banner_image_original = img.copy()
+        banner_image_original = load_banner_image(banner_path)
 
         banner_label = tk.Label(parent, bg=bg_color)
         banner_label.pack(pady=padding, fill=tk.X)
@@ -72,6 +110,7 @@ def resize_banner(parent, banner_label, banner_image_original, fixed_height=200)
     Resizes the banner image displayed in the given `banner_label` to fit the width of the parent widget
     while maintaining a fixed height. The banner is resized dynamically whenever the parent widget's width
     changes. This ensures that the banner always fits the available space and maintains its aspect ratio.
+    If the banner already has the target size, for example when the height of the parent changed, nothing is done.
 
     :param parent: The parent widget (usually a frame or window) whose width will determine the resized width of the banner.
     :param banner_label: The label widget that displays the banner image.
@@ -88,11 +127,16 @@ def resize_banner(parent, banner_label, banner_image_original, fixed_height=200)
         new_width = width
         new_height = fixed_height
 
+        # The banner already has this size, e.g. only the height of the parent changed
+        if getattr(banner_label, 'banner_size', None) == (new_width, new_height):
+            return
+
         resized_image = banner_image_original.resize((new_width, new_height), Image.Resampling.LANCZOS)
         banner_photo = ImageTk.PhotoImage(resized_image)
 
         banner_label.configure(image=banner_photo)
         banner_label.image = banner_photo
+        banner_label.banner_size = (new_width, new_height)
     except Exception as e:
         print(f"Error banner load: {e}")
 
@@ -113,11 +157,7 @@ def add_icon_and_label(parent, text, icon_path, bg_color):
     label_frame.pack(anchor="w", pady=2, padx=10, fill="x")
 
     try:
-        icon_image_original = Image.open(icon_path)
-        icon_image = icon_image_original.resize((INTERFACE['icon_dimensions'],
-                                                 INTERFACE['icon_dimensions']), Image.Resampling.LANCZOS)
-        icon_photo = ImageTk.PhotoImage(icon_image)
-        icon_image_original.close()
+        icon_photo = get_icon_image(icon_path, (INTERFACE['icon_dimensions'], INTERFACE['icon_dimensions']))
 
         icon_label = Label(label_frame, image=icon_photo, bg=bg_color)
         icon_label.image = icon_photo
@@ -493,9 +533,7 @@ def create_icon_label(frame, icon_path, icon_size=(INTERFACE['source_icon_dimens
     :return: None
     """
     try:
-        icon_image_original = Image.open(icon_path)
-        icon_image = icon_image_original.resize(icon_size, Image.Resampling.LANCZOS)
-        icon_photo = ImageTk.PhotoImage(icon_image)
+        icon_photo = get_icon_image(icon_path, tuple(icon_size))
 
         icon_label = tk.Label(frame, image=icon_photo, bg=bg_color)
         icon_label.image = icon_photo
@@ -584,7 +622,7 @@ def center_window_on_parent(parent_window, new_window, width, height):
     new_window.geometry(f"{width}x{height}+{center_x}+{center_y}")
 
 
-def load_tasks_from_json(json_file):
+def load_tasks_from_json(json_file, cache=None):
     """
     Loads the task list from a JSON file.
 
@@ -592,10 +630,18 @@ def load_tasks_from_json(json_file):
     If the file exists and is correctly formatted, it loads the tasks into the program.
     If the file does not exist or is corrupted, it handles the error gracefully and returns an empty dictionary.
 
+    Pending background writes of the file are waited for first, as the pages that load it save it themselves.
+    Pages that save the file through a `JsonCache` pass it as `cache`, and the parsed tasks are then kept
+    until the file changes on disk. Every call gets its own copy, as the pages change the returned tasks in place.
+
     :param json_file: The path to the JSON file that contains the task data.
+    :param cache: The `JsonCache` to read the file through, or None to read the file directly.
     :return: A dictionary containing the loaded tasks. If an error occurs, an empty dictionary is returned.
     """
     try:
+        json_cache.wait_for_writes(json_file)
+        if cache is not None:
+            return cache.get(json_file, copy=True)
         with open(json_file, "r", encoding='utf-8') as file:
             tasks = json.load(file)
             return tasks
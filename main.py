@@ -1,4 +1,5 @@
 from config.imports import *
+from config.json_cache import json_cache
 from src.useful_links import UsefulLinks
 from src.yearly_plans import YearlyPlans
 from src.lists_for_life import ListsForLife
@@ -43,6 +44,9 @@ class MainWindow(tk.Tk):
 
         self.load_app_icon()  # Add icon
 
+        self.json_cache = json_cache  # Parsed JSON files shared by the pages
+        self.json_cache.on_write_error = self.report_save_error
+
         # Left panel
         self.side_panel = tk.Frame(self, bg=SIDE_PANEL['bg_color'],
                                    width=SIDE_PANEL['width'])
@@ -81,6 +85,17 @@ class MainWindow(tk.Tk):
         except Exception as e:
             print(f"Icon load error: {e}")
 
+    def report_save_error(self, path, error):
+        """
+        Shows a failed background save of a JSON file to the user. Called in the writer thread,
+        so the message box is scheduled on the main thread.
+
+        :param path: Path to the JSON file that was not saved.
+        :param error: The error of the write.
+        :return: None
+        """
+        self.after(0, lambda: messagebox.showerror("Error", f"Could not save {path}: {error}"))
+
     def add_tab_button(self, tab):
         """
         Adds a button for a tab to the sidebar.
@@ -1,4 +1,5 @@
 from config.imports import *
+from config.json_cache import json_cache
 from config.settings import GRATITUDE_DIARY
 from config.utils import add_source_label_third_level as add_source_label_gratitude_diary, load_tasks_from_json
 import calendar
@@ -110,6 +111,7 @@ class GratitudeDiary(tk.Frame):
         """
         with open(self.json_file, "w", encoding="utf-8") as file:
             json.dump(self.tasks, file, ensure_ascii=False, indent=4)
+        json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
 
     def display_monthly_entries(self):
         """
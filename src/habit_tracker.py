@@ -2,6 +2,7 @@ from datetime import datetime
 from tkcalendar import Calendar
 from config.imports import *
 from config.settings import HABIT_TRACKER
+from config.json_cache import json_cache
 from config.utils import add_source_label_third_level as add_source_label_habit_tracker
 from datetime import date as setcalendardate
 
@@ -14,6 +15,7 @@ def load_tasks_from_json(json_file):
     :return: A dictionary containing the habit tracker data, or an empty dictionary if an error occurs.
     """
     try:
+        json_cache.wait_for_writes(json_file)  # This page saves the file itself
         with open(json_file, "r", encoding='utf-8') as file:
             tasks = json.load(file)
 
@@ -122,6 +124,7 @@ class HabitTracker(tk.Frame):
             week_starting_key = f"Week starting {selected_date_obj.strftime('%Y-%m-%d')}"
 
             # Load from JSON
+            json_cache.wait_for_writes(self.json_file)
             with open(self.json_file, 'r', encoding='utf-8') as f:
                 current_data = json.load(f)
 
@@ -135,6 +138,7 @@ class HabitTracker(tk.Frame):
             # Save to JSON
             with open(self.json_file, 'w', encoding='utf-8') as f:
                 json.dump(current_data, f, ensure_ascii=False, indent=4)
+            json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
 
             self.date_window.destroy()
 
@@ -481,6 +485,7 @@ class HabitTracker(tk.Frame):
         :return: None
         """
         try:
+            json_cache.wait_for_writes(self.json_file)
             with open(self.json_file, 'r', encoding='utf-8') as f:
                 current_data = json.load(f)
 
@@ -488,6 +493,7 @@ class HabitTracker(tk.Frame):
 
             with open(self.json_file, 'w', encoding='utf-8') as f:
                 json.dump(current_data, f, ensure_ascii=False, indent=4)
+            json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
 
         except Exception as e:
             print(f"Error saving to JSON: {e}")
@@ -1,5 +1,6 @@
 from config.imports import *
 from config.settings import MONTHLY_PLANS
+from config.json_cache import json_cache
 from config.utils import load_tasks_from_json
 from datetime import datetime
 from tkcalendar import Calendar as TkCalendar
@@ -1219,6 +1220,7 @@ class MonthlyPlans(tk.Frame):
         try:
             with open(self.json_file, "w", encoding="utf-8") as file:
                 json.dump(self.tasks, file, ensure_ascii=False, indent=4)
+            json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
         except Exception as e:
             print(f"Error saving tasks to {self.json_file}: {e}")
 
@@ -1,4 +1,5 @@
 from config.imports import *
+from config.json_cache import json_cache
 from config.settings import REVIEW
 from config.utils import add_source_label_third_level as add_source_label_review, load_tasks_from_json
 
@@ -138,6 +139,7 @@ class Review(tk.Frame):
         """
         with open(self.json_file, 'w') as file:
             json.dump(self.tasks, file, indent=4)
+        json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
 
     def navigate_to_yearly_plans(self):
         """
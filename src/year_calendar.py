@@ -3,6 +3,7 @@ from tkcalendar import Calendar as TkCalendar
 from datetime import datetime
 import datetime as mycalendardatestart
 from config.settings import CALENDAR
+from config.json_cache import json_cache
 from config.utils import add_source_label_third_level as add_source_label_calendar, load_tasks_from_json
 
 
@@ -190,6 +191,7 @@ class Calendar(tk.Frame):
         try:
             with open(self.json_file, "w", encoding='utf-8') as file:
                 json.dump(self.tasks, file, ensure_ascii=False, indent=4)
+            json_cache.invalidate(self.json_file)  # The yearly plans page reads this file through the cache
         except Exception as e:
             print(f"Error saving tasks to {self.json_file}: {e}")
 
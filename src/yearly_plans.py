@@ -1,7 +1,130 @@
 from config.imports import *
 from config.settings import YEARLY_PLANS
+from config.json_cache import json_cache
 from config.tooltip import ToolTip
+from config.utils import get_icon_image
+from src.year import Year
 import re
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Dates with a two-digit year: MM/DD/YY (e.g., "1/21/26") and DD.MM.YY (e.g., "01.05.25")
+_RE_MDY_SUB = re.compile(r'(\d{1,2}/\d{1,2}/)(\d{2})')
+_RE_DMY_SUB = re.compile(r'(\d{2}\.\d{2}\.)(\d{2})')
+
+# Any date in a string value, the matched group tells the format: 1 - YYYY-MM-DD, 2 - MM/DD/YY, 3 - DD.MM.YY
+_RE_ANY_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})|(\d{1,2}/\d{1,2}/\d{2})|(\d{2}\.\d{2}\.\d{2})')
+
+# Initial structure of a new year JSON, "__WEEK_KEY__" is replaced with the first week of the year
+_YEAR_DATA_TEMPLATE = {
+    "calendar": {},
+    "yearly_plans": [],
+    "habit_tracker": {
+        "__WEEK_KEY__": {
+            "Monday": [
+                {"task": "Reading", "completed": False},
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditation", "completed": False}
+            ],
+            "Tuesday": [
+                {"task": "Reading", "completed": False},
+                {"task": "Sports", "completed": False},
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditation", "completed": False}
+            ],
+            "Wednesday": [
+                {"task": "Reading", "completed": False},
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditation", "completed": False}
+            ],
+            "Thursday": [
+                {"task": "Reading", "completed": False},
+                {"task": "Sports", "completed": False},
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditate", "completed": False}
+            ],
+            "Friday": [
+                {"task": "Reading", "completed": False},
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditation", "completed": False}
+            ],
+            "Saturday": [
+                {"task": "Dreams", "completed": False},
+                {"task": "Meditation", "completed": False},
+                {"task": "Sports", "completed": False}
+            ],
+            "Sunday": [
+                {"task": "Rest :3", "completed": False}
+            ]
+        }
+    },
+    "gratitude_diary": {},
+    "best_in_months": {},
+    "months": {
+        "January": {
+            "plans": [],
+            "diary": {}
+        },
+        "February": {
+            "plans": [],
+            "diary": {}
+        },
+        "March": {
+            "plans": [],
+            "diary": {}
+        },
+        "April": {
+            "plans": [],
+            "diary": {}
+        },
+        "May": {
+            "plans": [],
+            "diary": {}
+        },
+        "June": {
+            "plans": [],
+            "diary": {}
+        },
+        "July": {
+            "plans": [],
+            "diary": {}
+        },
+        "August": {
+            "plans": [],
+            "diary": {}
+        },
+        "September": {
+            "plans": [],
+            "diary": {}
+        },
+        "October": {
+            "plans": [],
+            "diary": {}
+        },
+        "November": {
+            "plans": [],
+            "diary": {}
+        },
+        "December": {
+            "plans": [],
+            "diary": {}
+        }
+    },
+    "review": {
+        "1. How would you describe this year with a single word?": "",
+        "2. What is your biggest challenge this year?": "",
+        "3. One thing you are most proud of this year:": "",
+        "4. How did you take care of yourself this year?": "",
+        "5. How have you changed over the year": "",
+        "6. New things you learned:": "",
+        "7. What made this year special?": "",
+        "8. What are you most grateful for?": "",
+        "9. Top 3 priorities for the next year:": "",
+        "10. Did you do your best?": ""
+    }
+}
 
 
 def rename_year_file(old_year, new_year):
@@ -15,10 +138,13 @@ def rename_year_file(old_year, new_year):
     old_file_path = f"./data/years/{old_year}.json"
     new_file_path = f"./data/years/{new_year}.json"
 
-    if os.path.exists(old_file_path):
-        os.rename(old_file_path, new_file_path)
-    else:
+    json_cache.wait_for_writes(old_file_path)  # A pending save of the year page must land before the rename
+    try:
+        os.replace(old_file_path, new_file_path)
+    except FileNotFoundError:
         messagebox.showerror("Error", f"File for year {old_year} not found.")
+    json_cache.invalidate(old_file_path)
+    json_cache.invalidate(new_file_path)
 
 
 def update_year_paths_in_json(old_year, new_year):
@@ -33,6 +159,7 @@ def update_year_paths_in_json(old_year, new_year):
     """
     # Load the JSON data from the file
     json_file_path = f"./data/years/{old_year}.json"  # Replace with your actual JSON file path
+    json_cache.wait_for_writes(json_file_path)
 
     with open(json_file_path, 'r', encoding='utf-8') as json_file:
         data = json.load(json_file)
@@ -40,69 +167,98 @@ def update_year_paths_in_json(old_year, new_year):
     # Create the old year string for matching
     old_year_str = f"{old_year}"
     old_year_path_str = f"./assets/yearly_plans/year/{old_year}"
+    new_year_str = str(new_year)
+
+    # Old year as a whole word, compiled once for all the date-like strings
+    year_boundary_re = re.compile(r'\b' + re.escape(old_year_str) + r'\b')
+
+    # Replacement template keeping the day/month part and setting the new two-digit year
+    new_suffix = f"{new_year % 100:02d}"
+    date_suffix_template = r'\g<1>' + new_suffix
+
+    # Return the updated key, or None if the key does not need to change
+    def maybe_rewrite_key(key):
+        # Only keys starting with a digit can be dates, the others are checked for the old year only
+        first_char = key[:1]
+        is_digit_key = '0' <= first_char <= '9'
+
+        # Check if the key is a date in MM/DD/YY format (e.g., "1/21/26")
+        if is_digit_key and re.match(r'\d{1,2}/\d{1,2}/\d{2}', key):
+            logger.debug("Updating date key: %s", key)
+            new_key = _RE_MDY_SUB.sub(date_suffix_template, key)
+
+        # Check if the key is a date in DD.MM.YY format (e.g., "01.05.25")
+        elif is_digit_key and re.match(r'\d{2}\.\d{2}\.\d{2}', key):
+            logger.debug("Updating date key: %s", key)
+            new_key = _RE_DMY_SUB.sub(date_suffix_template, key)
+
+        # Check if the key contains the old year and replace it
+        elif old_year_str in key:
+            logger.debug("Updating key: %s", key)
+            new_key = key.replace(old_year_str, new_year_str)
+
+        else:
+            return None
+
+        logger.debug("Key updated to: %s", new_key)
+        return new_key if new_key != key else None
 
     # Define a function to recursively update the data
     def recursive_update(obj):
         if isinstance(obj, dict):
-            # Iterate over keys to update
-            keys_to_update = list(obj.keys())  # Make a list of current keys to modify
-            for key in keys_to_update:
-                value = obj[key]
-
-                # Check if the key is a date in MM/DD/YY format (e.g., "1/21/26")
-                if re.match(r'\d{1,2}/\d{1,2}/\d{2}', key):
-                    print(f"Updating date key: {key}")  # Debugging output
-                    new_key = re.sub(r'(\d{1,2}/\d{1,2}/)(\d{2})', lambda m: m.group(1) + str(new_year)[2:], key)
-                    obj[new_key] = obj.pop(key)  # Replace the old key with the new one
-                    print(f"Key updated to: {new_key}")  # Debugging output
-
-                # Check if the key is a date in DD.MM.YY format (e.g., "01.05.25")
-                elif re.match(r'\d{2}\.\d{2}\.\d{2}', key):
-                    print(f"Updating date key: {key}")  # Debugging output
-                    new_key = re.sub(r'(\d{2}\.\d{2}\.)(\d{2})', lambda m: m.group(1) + str(new_year)[2:], key)
-                    obj[new_key] = obj.pop(key)  # Replace the old key with the new one
-                    print(f"Key updated to: {new_key}")  # Debugging output
-
-                # Check if the key contains the old year and replace it
-                elif old_year_str in key:
-                    print(f"Updating key: {key}")  # Debugging output
-                    new_key = key.replace(old_year_str, str(new_year))
-                    obj[new_key] = obj.pop(key)  # Replace the old key with the new one
-                    print(f"Key updated to: {new_key}")  # Debugging output
+            # Collect the renamed keys first, the dictionary is rebuilt only if any key changes
+            renamed_keys = {}
+            for key, value in obj.items():
+                new_key = maybe_rewrite_key(key)
+                if new_key is not None:
+                    renamed_keys[key] = new_key
 
                 # Check if the value is a string, and replace the old year
                 if isinstance(value, str):
+                    new_value = value
+
                     # Replace the old year with the new year in paths, filenames, and other strings
-                    if old_year_str in value:
-                        print(f"Updating value: {value}")  # Debugging output
-                        obj[key] = value.replace(old_year_str, str(new_year))
+                    if old_year_str in new_value:
+                        logger.debug("Updating value: %s", new_value)
+                        new_value = new_value.replace(old_year_str, new_year_str)
 
                     # Replace paths that include the old year (e.g., ./assets/yearly_plans/year/{old_year})
-                    if old_year_path_str in value:
-                        print(f"Updating path: {value}")  # Debugging output
-                        obj[key] = value.replace(old_year_path_str, f"./assets/yearly_plans/year/{new_year}")
+                    if old_year_path_str in new_value:
+                        logger.debug("Updating path: %s", new_value)
+                        new_value = new_value.replace(old_year_path_str, f"./assets/yearly_plans/year/{new_year}")
+
+                    # Find all the date formats used in the string with a single scan
+                    date_formats = {match.lastindex for match in _RE_ANY_DATE.finditer(new_value)}
 
                     # Update year in date-like strings (e.g., "Week starting 2025-01-01")
-                    if re.search(r'\d{4}-\d{2}-\d{2}', value):
-                        print(f"Updating date-like string: {value}")  # Debugging output
-                        obj[key] = re.sub(r'\b' + old_year_str + r'\b', str(new_year), value)
+                    if 1 in date_formats:
+                        logger.debug("Updating date-like string: %s", new_value)
+                        new_value = year_boundary_re.sub(new_year_str, new_value)
 
                     # Update year in MM/DD/YY date format (e.g., "1/21/27" to "1/21/28")
-                    if re.search(r'\d{1,2}/\d{1,2}/\d{2}', value):
-                        print(f"Updating date (MM/DD/YY): {value}")  # Debugging output
-                        obj[key] = re.sub(r'(\d{1,2}/\d{1,2}/)(\d{2})', lambda m: m.group(1) + str(new_year)[2:],
-                                          value)
+                    if 2 in date_formats:
+                        logger.debug("Updating date (MM/DD/YY): %s", new_value)
+                        new_value = _RE_MDY_SUB.sub(date_suffix_template, new_value)
 
                     # Update year in DD.MM.YY date format (e.g., "01.05.25" to "01.05.26")
-                    if re.search(r'\d{2}\.\d{2}\.\d{2}', value):
-                        print(f"Updating date (DD.MM.YY): {value}")  # Debugging output
-                        obj[key] = re.sub(r'(\d{2}\.\d{2}\.)(\d{2})', lambda m: m.group(1) + str(new_year)[2:],
-                                          value)
+                    if 3 in date_formats:
+                        logger.debug("Updating date (DD.MM.YY): %s", new_value)
+                        new_value = _RE_DMY_SUB.sub(date_suffix_template, new_value)
+
+                    # Replacing the value of an existing key is safe while iterating
+                    if new_value != value:
+                        obj[key] = new_value
 
                 # Recurse for nested dictionaries or lists
                 elif isinstance(value, (dict, list)):
                     recursive_update(value)
 
+            # Rebuild the dictionary with the new keys, keeping the original order
+            if renamed_keys:
+                items = [(renamed_keys.get(key, key), value) for key, value in obj.items()]
+                obj.clear()
+                obj.update(items)
+
         elif isinstance(obj, list):
             for item in obj:
                 if isinstance(item, (dict, list)):
@@ -112,8 +268,8 @@ def update_year_paths_in_json(old_year, new_year):
     recursive_update(data)
 
     # Save the updated JSON data back to the file
-    with open(json_file_path, 'w', encoding='utf-8') as json_file:
-        json.dump(data, json_file, ensure_ascii=False, indent=4)
+    with open(json_file_path, 'w', encoding='utf-8', buffering=1 << 20) as json_file:
+        json_file.write(json.dumps(data, ensure_ascii=False, indent=4))
 
 
 def delete_year_file(year):
@@ -124,10 +280,12 @@ def delete_year_file(year):
     :return: None
     """
     year_file_path = f"./data/years/{year}.json"
-    if os.path.exists(year_file_path):
+    json_cache.wait_for_writes(year_file_path)
+    try:
         os.remove(year_file_path)  # Delete file
-    else:
+    except FileNotFoundError:
         print(f"File for year {year} not found.")
+    json_cache.invalidate(year_file_path)
 
 
 def create_year_json(year):
@@ -146,119 +304,19 @@ def create_year_json(year):
     # If folder data/years
     os.makedirs(os.path.dirname(year_json_path), exist_ok=True)  # Создаем папку, если она не существует
 
-    # If file exists
-    if not os.path.exists(year_json_path):
-        year_data = {
-            "calendar": {},
-            "yearly_plans": [],
-            "habit_tracker": {
-                f"Week starting {year}-01-01": {
-                    "Monday": [
-                        {"task": "Reading", "completed": False},
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditation", "completed": False}
-                    ],
-                    "Tuesday": [
-                        {"task": "Reading", "completed": False},
-                        {"task": "Sports", "completed": False},
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditation", "completed": False}
-                    ],
-                    "Wednesday": [
-                        {"task": "Reading", "completed": False},
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditation", "completed": False}
-                    ],
-                    "Thursday": [
-                        {"task": "Reading", "completed": False},
-                        {"task": "Sports", "completed": False},
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditate", "completed": False}
-                    ],
-                    "Friday": [
-                        {"task": "Reading", "completed": False},
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditation", "completed": False}
-                    ],
-                    "Saturday": [
-                        {"task": "Dreams", "completed": False},
-                        {"task": "Meditation", "completed": False},
-                        {"task": "Sports", "completed": False}
-                    ],
-                    "Sunday": [
-                        {"task": "Rest :3", "completed": False}
-                    ]
-                }
-            },
-            "gratitude_diary": {},
-            "best_in_months": {},
-            "months": {
-                "January": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "February": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "March": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "April": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "May": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "June": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "July": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "August": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "September": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "October": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "November": {
-                    "plans": [],
-                    "diary": {}
-                },
-                "December": {
-                    "plans": [],
-                    "diary": {}
-                }
-            },
-            "review": {
-                "1. How would you describe this year with a single word?": "",
-                "2. What is your biggest challenge this year?": "",
-                "3. One thing you are most proud of this year:": "",
-                "4. How did you take care of yourself this year?": "",
-                "5. How have you changed over the year": "",
-                "6. New things you learned:": "",
-                "7. What made this year special?": "",
-                "8. What are you most grateful for?": "",
-                "9. Top 3 priorities for the next year:": "",
-                "10. Did you do your best?": ""
-            }
-        }
+    # Create the file only if it does not exist yet
+    try:
+        file = open(year_json_path, 'x', encoding='utf-8', buffering=1 << 20)
+    except FileExistsError:
+        return
 
-        # Save to JSON
-        with open(year_json_path, 'w', encoding='utf-8') as file:
-            json.dump(year_data, file, indent=4, ensure_ascii=False)
+    year_data = copy.deepcopy(_YEAR_DATA_TEMPLATE)
+    habit_tracker = year_data["habit_tracker"]
+    habit_tracker[f"Week starting {year}-01-01"] = habit_tracker.pop("__WEEK_KEY__")
+
+    # Save to JSON
+    with file:
+        file.write(json.dumps(year_data, indent=4, ensure_ascii=False))
 
 
 class YearlyPlans(tk.Frame):
@@ -266,6 +324,7 @@ class YearlyPlans(tk.Frame):
     A class that represents the Yearly Plans page in the application. This page allows the user to view,
     create, edit, and delete yearly plans.
     """
+
     def __init__(self, parent, main_window, json_file):
         """
         Initializes the YearlyPlans page with the provided parent, main window, and JSON file.
@@ -281,10 +340,10 @@ class YearlyPlans(tk.Frame):
 
         self.year_buttons = []
         self.json_file = json_file
+        self._years_set = set()  # Years of the data in self._years_set_source, for membership checks
+        self._years_set_source = None
 
-        self.icon_image_original = Image.open(ICONS_PATHS['yearly_plans'])  # Year icon path
-        self.icon_image = self.icon_image_original.resize((20, 20), Image.Resampling.LANCZOS)
-        self.icon_photo = ImageTk.PhotoImage(self.icon_image)
+        self.icon_photo = get_icon_image(ICONS_PATHS['yearly_plans'], (20, 20))  # Year icon path
 
         add_source_label(self, ICONS_PATHS['yearly_plans'], PAGES_NAMES['yearly_plans'],
                          bg_color=INTERFACE['bg_color'], font=INTERFACE['source_label_font'])
@@ -315,16 +374,6 @@ class YearlyPlans(tk.Frame):
 
         self.load_year_buttons()  # Add year buttons
 
-    def bind_right_click_to_buttons(self):
-        """
-        Binds the right-click (Button-3) event to each year button. When a button is right-clicked,
-        it triggers the context menu (typically for editing or deleting the year).
-
-        :return: None
-        """
-        for button in self.year_buttons:
-            button.bind("<Button-3>", lambda event, button=button: self.show_context_menu(event, button))
-
     def show_context_menu(self, event, year_button):
         """
         Displays a context menu when a right-click (Button-3) event occurs on a year button.
@@ -400,10 +449,27 @@ class YearlyPlans(tk.Frame):
         if new_year_str.isdigit():
             new_year = int(new_year_str)
 
+            old_folder = f"./assets/yearly_plans/year/{old_year}"
+            new_folder = f"./assets/yearly_plans/year/{new_year}"
+
             # Check if the year exists
             if self.is_year_exists(new_year):
                 messagebox.showerror("Error", f"Year {new_year} already exists.")
+            # A leftover data file or asset folder of the new year would be overwritten, or stop the folder rename
+            elif os.path.exists(f"./data/years/{new_year}.json") or (os.path.isdir(old_folder)
+                                                                       and os.path.exists(new_folder)):
+                messagebox.showerror("Error", f"A data file or an asset folder for year {new_year} already exists.")
             else:
+                # Rename the folder for the year first if it exists, so a failed rename leaves everything unchanged.
+                # Both paths are in the same directory
+                try:
+                    os.replace(old_folder, new_folder)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    messagebox.showerror("Error", f"Could not rename the folder of year {old_year}: {e}")
+                    return
+
                 # Update the paths in JSON that reference the old year
                 update_year_paths_in_json(old_year, new_year)
 
@@ -413,15 +479,6 @@ class YearlyPlans(tk.Frame):
                 # Rename year JSON
                 rename_year_file(old_year, new_year)
 
-                # Rename the folder for the year
-                old_folder = f"./assets/yearly_plans/year/{old_year}"
-                new_folder = f"./assets/yearly_plans/year/{new_year}"
-
-                # Check if the old folder exists and rename it
-                if os.path.exists(old_folder):
-                    # Rename the folder
-                    shutil.move(old_folder, new_folder)
-
                 # Update year button text
                 year_button.config(text=str(new_year))
 
@@ -442,20 +499,17 @@ class YearlyPlans(tk.Frame):
         :param new_year: The new year value to replace the old one.
         :return: None
         """
-        if os.path.exists(self.json_file):
-            with open(self.json_file, 'r') as file:
-                data = json.load(file)
+        data = self._load_years()
 
-            # Update year
-            for year_data in data["years"]:
-                if year_data["year"] == old_year:
-                    year_data["year"] = new_year
-                    year_data["json_path"] = f"./data/years/{new_year}.json"
-                    break
+        # Update year
+        for year_data in data["years"]:
+            if year_data["year"] == old_year:
+                year_data["year"] = new_year
+                year_data["json_path"] = f"./data/years/{new_year}.json"
 
-            # Save to JSON
-            with open(self.json_file, 'w') as file:
-                json.dump(data, file, indent=4)
+                # Save to JSON
+                self._save_years(data)
+                break
 
     def delete_year(self, year_button):
         """
@@ -478,9 +532,9 @@ class YearlyPlans(tk.Frame):
             year_folder = f'./assets/yearly_plans/year/{year}'
 
             # Delete folder
-            if os.path.exists(year_folder):
+            try:
                 shutil.rmtree(year_folder)
-            else:
+            except FileNotFoundError:
                 print(f"Folder {year_folder} does not exist.")
 
             # Delete button
@@ -498,16 +552,13 @@ class YearlyPlans(tk.Frame):
         :param year: The year to be deleted from the JSON file.
         :return: None
         """
-        if os.path.exists(self.json_file):
-            with open(self.json_file, 'r') as file:
-                data = json.load(file)
+        data = self._load_years()
 
-            # Delete specific year entry
-            data["years"] = [item for item in data["years"] if item["year"] != year]
+        # Delete specific year entry
+        data["years"] = [item for item in data["years"] if item["year"] != year]
 
-            # Save to JSON
-            with open(self.json_file, 'w') as file:
-                json.dump(data, file, indent=4)
+        # Save to JSON
+        self._save_years(data)
 
     def load_year_buttons(self):
         """
@@ -518,42 +569,29 @@ class YearlyPlans(tk.Frame):
 
         :return: None
         """
-        yearly_plans_path = self.json_file
-
-        if os.path.exists(yearly_plans_path):
-            with open(yearly_plans_path, 'r') as file:
-                try:
-                    data = json.load(file)
-                except json.JSONDecodeError:
-                    print("Error loading JSON data. Initializing with empty data.")
-                    data = {"years": []}
-
-            # Reverse the list of years to display the most recent first
-            years = data.get("years", [])
-            years.reverse()  # This will reverse the list in-place
-
-            for item in years:
-                year = item.get("year")
-                if year is not None:
-                    year_button = tk.Button(
-                        self.year_buttons_frame,
-                        text=str(year),
-                        command=lambda y=year: self.open_year_page(y),
-                        image=self.icon_photo,
-                        compound=tk.LEFT,
-                        font=YEARLY_PLANS['year_buttons_font']
-                    )
-                    year_button.pack(side=tk.TOP, pady=5)
-                    year_button.config(cursor="hand2")
-
-                    # Tooltip for right-click instructions
-                    ToolTip(year_button, "Right click to edit/delete")
-                    self.year_buttons.append(year_button)
-
-            # Bind right-click events to the buttons
-            self.bind_right_click_to_buttons()
-        else:
-            print(f"{yearly_plans_path} does not exist. No buttons created.")
+        data = self._load_years()
+
+        # Iterate over the years in reverse to display the most recent first, the cached list is left as is
+        for item in reversed(data["years"]):
+            year = item.get("year")
+            if year is not None:
+                year_button = tk.Button(
+                    self.year_buttons_frame,
+                    text=str(year),
+                    command=lambda y=year: self.open_year_page(y),
+                    image=self.icon_photo,
+                    compound=tk.LEFT,
+                    font=YEARLY_PLANS['year_buttons_font']
+                )
+                year_button.grid(row=len(self.year_buttons), column=0, pady=5, sticky="w")
+                year_button.config(cursor="hand2")
+
+                # Tooltip for right-click instructions
+                ToolTip(year_button, "Right click to edit/delete")
+                self.year_buttons.append(year_button)
+
+                # Right click opens the edit/delete context menu
+                year_button.bind("<Button-3>", lambda event, b=year_button: self.show_context_menu(event, b))
 
     def add_quote_and_image(self):
         """
@@ -576,8 +614,8 @@ class YearlyPlans(tk.Frame):
         pin_label_frame.grid(row=0, column=0, padx=10, pady=5, sticky="nw")
 
         # Load pin image
-        pin_icon = PhotoImage(file=YEARLY_PLANS['pin_icon_path']).subsample(2, 2)
-        smile_icon = PhotoImage(file=YEARLY_PLANS['smile_icon_path']).subsample(2, 2)
+        pin_icon = get_icon_image(YEARLY_PLANS['pin_icon_path'], YEARLY_PLANS['pin_icon_size'])
+        smile_icon = get_icon_image(YEARLY_PLANS['smile_icon_path'], YEARLY_PLANS['pin_icon_size'])
 
         # Pin label
         pin_label_icon = tk.Label(pin_label_frame, image=pin_icon, bg=YEARLY_PLANS['pin_label_bg'])
@@ -681,8 +719,7 @@ class YearlyPlans(tk.Frame):
 
             # Create new folder
             year_folder = f'./assets/yearly_plans/year/{year}'
-            if not os.path.exists(year_folder):
-                os.makedirs(year_folder)
+            os.makedirs(year_folder, exist_ok=True)
 
             # Create year button
             year_button = tk.Button(
@@ -693,8 +730,6 @@ class YearlyPlans(tk.Frame):
                 compound=tk.LEFT,
                 font=("Arial", 12)
             )
-            # Pack the new button at the top
-            year_button.pack(side=tk.TOP, pady=5, anchor="w")
             year_button.config(cursor="hand2")
 
             # Add to yearly_plans.json
@@ -706,9 +741,11 @@ class YearlyPlans(tk.Frame):
             # Add tooltip
             ToolTip(year_button, "Right click to edit/delete")
             self.year_buttons.insert(0, year_button)  # Insert the button at the start of the list
-            self.bind_right_click_to_buttons()
 
-            # Rearrange the packing to ensure the new button is on top
+            # Right click opens the edit/delete context menu
+            year_button.bind("<Button-3>", lambda event, b=year_button: self.show_context_menu(event, b))
+
+            # Move the rows down so the new button is on top
             self.rearrange_year_buttons()
 
             # Close the dialog
@@ -722,15 +759,13 @@ class YearlyPlans(tk.Frame):
         Rearranges the year buttons to ensure they are displayed in the correct order,
         with the most recent year appearing at the top.
 
+        Each button is placed in the grid row matching its position in the list. The buttons stay managed by
+        the grid, so Tk lays out the frame once instead of forgetting and repacking every button.
+
         :return: None
         """
-        # Clear all the year buttons from the frame
-        for button in self.year_buttons:
-            button.pack_forget()
-
-        # Repack the buttons with the most recent year at the top
-        for button in self.year_buttons:
-            button.pack(side=tk.TOP, pady=5, anchor="w")
+        for row, button in enumerate(self.year_buttons):
+            button.grid_configure(row=row, column=0, pady=5, sticky="w")
 
     def is_year_exists(self, year):
         """
@@ -739,15 +774,7 @@ class YearlyPlans(tk.Frame):
         :param year: The year to check for in the JSON data (can be int or str).
         :return: True if the year exists, False otherwise.
         """
-        try:
-            with open(self.json_file, 'r') as file:
-                data = json.load(file)
-            for item in data.get("years", []):
-                if item["year"] == year:
-                    return True
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-        return False
+        return year in self._load_year_set()
 
     def update_yearly_plans(self, year):
         """
@@ -762,32 +789,65 @@ class YearlyPlans(tk.Frame):
         :param year: The year to be added to the `yearly_plans.json` file.
         :return: None
         """
-        # Path to yearly_plans.json
-        yearly_plans_path = self.json_file
+        data = self._load_years()
 
-        # If file exists
-        if os.path.exists(yearly_plans_path):
-            with open(yearly_plans_path, 'r') as file:
-                try:
-                    data = json.load(file)
-                except json.JSONDecodeError:
-                    data = {"years": []}
-        else:
-            data = {"years": []}
+        if not any(item["year"] == year for item in data["years"]):
+            year_data = {
+                "year": year,
+                "json_path": f"./data/years/{year}.json"
+            }
+            data["years"].append(year_data)
+
+        self._save_years(data)
+
+    def _load_years(self):
+        """
+        Returns the yearly_plans.json data from the application JSON cache, which parses the file again
+        only if it changed since it was cached.
+
+        If the file does not exist, is corrupted or has no "years" key, the data is initialized with an empty list.
+
+        :return: A dictionary with the "years" list.
+        """
+        try:
+            data = self.main_window.json_cache.get(self.json_file)
+        except FileNotFoundError:
+            print(f"{self.json_file} does not exist. Initializing with empty data.")
+            return {"years": []}
+        except json.JSONDecodeError:
+            print("Error loading JSON data. Initializing with empty data.")
+            data = None
 
         # Check if the data is a dictionary and contains the "years" key
-        if isinstance(data, dict) and "years" in data:
-            if not any(item["year"] == year for item in data["years"]):
-                year_data = {
-                    "year": year,
-                    "json_path": f"./data/years/{year}.json"
-                }
-                data["years"].append(year_data)
-        else:
-            data = {"years": [{"year": year, "json_path": f"./data/years/{year}.json"}]}
+        if not isinstance(data, dict) or "years" not in data:
+            data = {"years": []}
+            self.main_window.json_cache.put(self.json_file, data)
 
-        with open(yearly_plans_path, 'w') as file:
-            json.dump(data, file, indent=4)
+        return data
+
+    def _load_year_set(self):
+        """
+        Returns the set of years in the yearly_plans.json data, built again only when the data changed.
+
+        :return: A set of years.
+        """
+        data = self._load_years()
+        if data is not self._years_set_source:
+            self._years_set = {item["year"] for item in data["years"]}
+            self._years_set_source = data
+        return self._years_set
+
+    def _save_years(self, data):
+        """
+        Saves the yearly plans data through the application JSON cache. The cache holds the new data right away,
+        so the next read does not parse the file again, and writes it compactly in the background, replacing
+        the file atomically so an interrupted save cannot leave a truncated file behind.
+
+        :param data: A dictionary with the "years" list.
+        :return: None
+        """
+        self.main_window.json_cache.save(self.json_file, data, separators=(',', ':'))
+        self._years_set_source = None  # The data may have been changed in place
 
     def open_year_page(self, year):
         """
@@ -802,7 +862,6 @@ class YearlyPlans(tk.Frame):
         """
         self.main_window.clear_canvas()
 
-        from src.year import Year
         year_frame = Year(self.parent, json_file=f"./data/years/{year}.json", main_window=self.main_window, year=year)
         year_frame.pack(fill=tk.BOTH, expand=True)
 
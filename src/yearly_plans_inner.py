@@ -1,6 +1,14 @@
 from config.imports import *
 from config.settings import YEARLY_PLANS_INNER
-from config.utils import add_source_label_third_level as add_source_label_yearly_plans_inner, load_tasks_from_json
+from config.utils import (add_source_label_third_level as add_source_label_yearly_plans_inner, load_tasks_from_json,
+                          get_icon_image)
+from functools import partial
+import collections
+import uuid
+import src.year  # src.year imports this module, Year is looked up when a year page is opened
+
+# Maximum number of hidden task frames kept for reuse
+WIDGET_POOL_SIZE = 1024
 
 
 class YearlyPlansInner(tk.Frame):
@@ -18,7 +26,10 @@ class YearlyPlansInner(tk.Frame):
         parent (tk.Widget): The parent widget for this frame.
         json_file (str): The path to the JSON file containing task data.
         tasks (dict): A dictionary containing the task data loaded from the JSON file.
-        yearly_plans (list): A list of yearly plans loaded from the task data.
+        yearly_plans (list): A list of the displayed yearly plans, in display order.
+        _task_index (dict): Maps the task text to its entry in the yearly plans list.
+        _task_index_by_id (dict): Maps the id of a displayed task widget to its entry in the yearly plans list.
+            It holds the tasks of the page, the yearly plans list is built from it when saving.
     """
 
     def __init__(self, parent, main_window, json_file, year):
@@ -36,10 +47,20 @@ class YearlyPlansInner(tk.Frame):
         self.year = year
         self.parent = parent
         self.json_file = json_file  # Path to JSON
-        self.task_vars = []
+        self._save_job = None  # Pending delayed save of the tasks
+        self._scrollbar_check_pending = False
+        self._widget_pool = collections.deque()  # Frames of removed tasks, reused for new tasks
+        self._banner_resize_job = None  # Pending delayed banner resize
+
+        self.tasks = load_tasks_from_json(json_file, cache=main_window.json_cache)
+        yearly_plans = self.tasks.setdefault("yearly_plans", [])
 
-        self.tasks = load_tasks_from_json(json_file)
-        self.yearly_plans = self.tasks.get("yearly_plans", [])
+        # Task text -> task info, for lookups without scanning the list
+        self._task_index = {}
+        # Task id -> task info, ids are given to the task widgets and do not change when the task is edited
+        self._task_index_by_id = {}
+        for task_info in yearly_plans:
+            self._task_index.setdefault(task_info["task"], task_info)
 
         add_source_label_yearly_plans_inner(self,
                                             icon_path_1=ICONS_PATHS['yearly_plans'],
@@ -60,13 +81,7 @@ class YearlyPlansInner(tk.Frame):
 
         # resize_banner
         if self.banner_label and self.banner_image_original:
-            self.bind("<Configure>", lambda event: resize_banner(
-                self,
-                self.banner_label,
-                self.banner_image_original
-            ))
-
-        self.icon_image_original = Image.open(ICONS_PATHS['yearly_plans_inner'])
+            self.bind("<Configure>", self._on_configure)
 
         add_icon_and_label(self, text=PAGES_NAMES['yearly_plans_inner'],
                            icon_path=ICONS_PATHS['yearly_plans_inner'],
@@ -78,7 +93,48 @@ class YearlyPlansInner(tk.Frame):
 
         self.after(10, self.main_window.check_scrollbar)
 
-    def edit_task(self, task, frame):
+        # Save the statuses that are still waiting for the delayed save when the page is closed
+        self.bind("<Destroy>", self.flush_pending_save)
+        self.bind("<Destroy>", self._cancel_banner_resize, add="+")
+
+    def _on_configure(self, event):
+        """
+        Resizes the banner 50 ms after the page size stops changing. Resizing the banner image is expensive,
+        so the resize is restarted on every <Configure> event and a window drag results in one resize per pause.
+        The first event resizes the banner right away, so the page does not show it unscaled.
+
+        :param event: The <Configure> event.
+        :return: None
+        """
+        if getattr(self.banner_label, 'banner_size', None) is None:
+            self._resize_banner()
+            return
+
+        if self._banner_resize_job is not None:
+            self.after_cancel(self._banner_resize_job)
+        self._banner_resize_job = self.after(50, self._resize_banner)
+
+    def _resize_banner(self):
+        """
+        Runs the banner resize scheduled by `_on_configure`.
+
+        :return: None
+        """
+        self._banner_resize_job = None
+        resize_banner(self, self.banner_label, self.banner_image_original)
+
+    def _cancel_banner_resize(self, event=None):
+        """
+        Cancels a pending banner resize when the page is destroyed.
+
+        :param event: The <Destroy> event.
+        :return: None
+        """
+        if self._banner_resize_job is not None:
+            self.after_cancel(self._banner_resize_job)
+            self._banner_resize_job = None
+
+    def edit_task(self, task_id, frame):
         """
         Opens a new window for editing a task.
 
@@ -87,10 +143,12 @@ class YearlyPlansInner(tk.Frame):
         provides an option to save the changes. The window also includes a Save button,
         and pressing the Enter key will save the changes as well.
 
-        :param task: The task to be edited. This is the initial content of the text field.
+        :param task_id: The id of the task to be edited. Its current text is the initial content of the text field.
         :param frame: The parent frame where the task is located. It will be updated after saving the changes.
         :return: None
         """
+        task = self._task_index_by_id[task_id]["task"]
+
         edit_window = tk.Toplevel(self)
         edit_window.withdraw()
         edit_window.title("Edit task")
@@ -98,52 +156,67 @@ class YearlyPlansInner(tk.Frame):
         center_window_on_parent(self.main_window, edit_window, 400, 100)
 
         try:
-            icon_image = Image.open(APP['icon_path'])
-            icon_photo = ImageTk.PhotoImage(icon_image)
-            edit_window.iconphoto(False, icon_photo)
+            edit_window.iconphoto(False, get_icon_image(APP['icon_path']))
         except Exception as e:
             print(f"Error icon load: {e}")
 
         task_entry = tk.Entry(edit_window, font=YEARLY_PLANS_INNER['toplevel_windows_font'], width=40)
         task_entry.insert(0, task)
         task_entry.pack(pady=10)
-        task_entry.bind("<Return>", lambda event: self.save_task_changes(task, task_entry.get(), edit_window, frame))
+        task_entry.bind("<Return>",
+                        lambda event: self.save_task_changes(task_id, task_entry.get(), edit_window, frame))
 
         # Save button
         save_button = tk.Button(edit_window, text="Save", font=YEARLY_PLANS_INNER['toplevel_windows_font'],
-                                command=lambda: self.save_task_changes(task, task_entry.get(), edit_window, frame))
+                                command=lambda: self.save_task_changes(task_id, task_entry.get(), edit_window, frame))
         save_button.pack(pady=5)
         save_button.config(cursor="hand2")
 
         edit_window.deiconify()
 
-    def save_task_changes(self, old_task, new_task_text, edit_window, frame):
+    def save_task_changes(self, task_id, new_task_text, edit_window, frame):
         """
         Saves changes to a task and updates the relevant UI elements.
 
-        This method finds the task in the internal list (`self.tasks["yearly_plans"]`)
-        that matches the `old_task`, updates its text with the `new_task_text`,
-        and then saves the changes to the JSON file. It also updates the text of
-        any associated UI elements (such as checkbuttons) in the given frame to reflect
-        the updated task text. Finally, it closes the edit window.
+        This method looks up the task by its id, updates its text with the `new_task_text`,
+        and then saves the changes to the JSON file. Surrounding whitespace is stripped from the new text;
+        if the text is empty or another task already has it, an error message is shown and nothing is changed,
+        and if it matches the current text, the window is closed without saving. It also updates the text of the
+        checkbutton stored on the given frame to reflect the updated task text.
+        Finally, it closes the edit window.
 
-        :param old_task: The current text of the task that is being edited.
+        :param task_id: The id of the task that is being edited.
         :param new_task_text: The new text to update the task with.
         :param edit_window: The window where the task is being edited. It will be closed after saving the changes.
         :param frame: The frame containing the task's UI elements (such as checkbuttons) to be updated with the new text.
         :return: None
         """
-        for task_info in self.tasks["yearly_plans"]:
-            if task_info["task"] == old_task:
-                task_info["task"] = new_task_text
-                break
+        task_info = self._task_index_by_id[task_id]
+        old_task = task_info["task"]
+        new_task_text = new_task_text.strip()
+
+        if not new_task_text:
+            messagebox.showinfo("Error", "Task cannot be empty.")
+            return
+
+        # Nothing changed apart from surrounding whitespace, no need to rewrite the JSON
+        if new_task_text == old_task:
+            edit_window.destroy()
+            return
+
+        if new_task_text in self._task_index:
+            messagebox.showinfo("Error", "Task already exists.")
+            return
+
+        if self._task_index.get(old_task) is task_info:
+            del self._task_index[old_task]
+        task_info["task"] = new_task_text
+        self._task_index[new_task_text] = task_info
 
         # Save to JSON
-        self.save_tasks_to_json()
+        self._schedule_save()
 
-        for widget in frame.winfo_children():
-            if isinstance(widget, tk.Checkbutton):
-                widget.config(text=new_task_text)
+        frame.check_button.config(text=new_task_text)
 
         edit_window.destroy()
 
@@ -174,80 +247,138 @@ class YearlyPlansInner(tk.Frame):
 
         This method iterates through the list of tasks in `self.tasks["yearly_plans"]`,
         and for each task, it creates a corresponding widget to display the task
-        and its completion status. After displaying each task, the method ensures that
-        the scrollbar (if any) is correctly updated in the main window.
+        and its completion status. The scrollbar is not checked here, the page checks it once
+        after it is built, as each check forces a layout pass over the whole canvas.
 
         :return: None
         """
 
         for task_info in self.tasks.get("yearly_plans", []):
-            task = task_info["task"]
-            done = task_info["done"]
-
             # Create widget for each task
-            self.create_task_widget(task, done)
-
-            self.main_window.check_scrollbar()
+            self.create_task_widget(task_info)
 
-    def create_task_widget(self, task, done):
+    def create_task_widget(self, task_info):
         """
         Creates a widget for displaying a task with options to edit, delete, and toggle its completion status.
 
         This method creates a frame for each task that includes a checkbox to mark the task as done or undone,
         a button to delete the task, and a button to edit the task. It uses the provided task text and its
-        completion status to set up the UI. The checkbox state is bound to a Boolean variable to track whether
-        the task is completed or not.
+        completion status to set up the UI. The checkbox is set from the task's "done" status, which is flipped
+        on every click, so no tk.BooleanVar is created per task.
 
-        :param task: The text description of the task to be displayed.
-        :param done: The current completion status of the task (True if completed, False if not).
+        The task gets an id that the widget callbacks refer to, so they keep working after the task text is edited.
+        The widgets are stored on the frame to be updated directly. A frame left by a removed task is reused
+        if there is one, instead of creating new widgets.
+
+        :param task_info: The task dictionary with the text ("task") and completion status ("done") to be displayed.
         :return: None
         """
-        frame = tk.Frame(self, bg=INTERFACE['bg_color'])
+        task_id = uuid.uuid4().hex
+        self._task_index_by_id[task_id] = task_info
+
+        frame = self._widget_pool.pop() if self._widget_pool else self._build_task_frame()
+        frame.task_id = task_id
+
+        frame.check_button.config(text=task_info["task"], command=partial(self.update_task_status, task_id))
+        if task_info["done"]:
+            frame.check_button.select()
+        else:
+            frame.check_button.deselect()
+
+        frame.delete_button.config(command=partial(self.remove_task, task_id, frame))
+        frame.edit_button.config(command=partial(self.edit_task, task_id, frame))
+
         frame.pack(fill=tk.X, padx=10, pady=5)
 
-        var = tk.BooleanVar(value=done)
+    def _build_task_frame(self):
+        """
+        Builds the frame of a task row with its checkbox, Delete and Edit buttons, stored on the frame.
+        The task text, state and commands are set by `create_task_widget`.
 
-        # Task checkbox
-        check_button = tk.Checkbutton(frame, text=task, variable=var, bg=INTERFACE['bg_color'],
-                                      font=YEARLY_PLANS_INNER['tasks_font'],
-                                      command=lambda: self.update_task_status(task, var))
+        :return: The frame, not packed yet.
+        """
+        frame = tk.Frame(self, bg=INTERFACE['bg_color'])
+
+        # Task checkbox. Its variable is a plain Tcl variable named after the checkbox, kept when the frame is reused
+        # and unset when the checkbox is destroyed. Without it all checkboxes would share the default variable
+        # named after the widget ("!checkbutton") and toggle together
+        check_button = tk.Checkbutton(frame, bg=INTERFACE['bg_color'], font=YEARLY_PLANS_INNER['tasks_font'])
+        check_button.config(variable=str(check_button))
+        check_button.bind("<Destroy>", self._unset_check_variable)
         check_button.pack(side=tk.LEFT)
         check_button.config(cursor="hand2")
 
         # Delete button
         delete_button = tk.Button(frame, text="Delete", bg=YEARLY_PLANS_INNER['delete_button_color'],
-                                  font=YEARLY_PLANS_INNER['buttons_font'],
-                                  command=lambda: self.remove_task(task, frame))
+                                  font=YEARLY_PLANS_INNER['buttons_font'])
         delete_button.pack(side=tk.RIGHT, padx=5)
         delete_button.config(cursor="hand2")
 
         # Edit button
-        edit_button = tk.Button(frame, text="Edit", font=YEARLY_PLANS_INNER['buttons_font'],
-                                command=lambda: self.edit_task(task, frame))
+        edit_button = tk.Button(frame, text="Edit", font=YEARLY_PLANS_INNER['buttons_font'])
         edit_button.pack(side=tk.RIGHT, padx=5)
         edit_button.config(cursor="hand2")
 
-        # Add variable True/False
-        self.task_vars.append((task, var))
+        frame.check_button = check_button
+        frame.delete_button = delete_button
+        frame.edit_button = edit_button
+        return frame
+
+    def _unset_check_variable(self, event):
+        """
+        Unsets the Tcl variable of a destroyed task checkbox, see `_build_task_frame`.
+
+        :param event: The <Destroy> event of the checkbox.
+        :return: None
+        """
+        try:
+            self.tk.globalunsetvar(str(event.widget))
+        except tk.TclError:
+            pass
 
-    def update_task_status(self, task, var):
+    def update_task_status(self, task_id):
         """
         Updates the completion status of a task.
 
         This method is called when a user interacts with the checkbox to mark a task as completed or undone.
-        It updates the `done` status of the task in the internal task list and saves the updated tasks to the JSON file.
+        It updates the `done` status of the task in the internal task list and schedules saving the updated tasks
+        to the JSON file, so a burst of clicks results in a single write.
+
+        The checkbox has already switched its state when this is called, so the status is flipped to match it.
+
+        :param task_id: The id of the task whose completion status needs to be updated.
+        :return: None
+        """
+        task_info = self._task_index_by_id[task_id]
+        task_info["done"] = not task_info["done"]
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """
+        Schedules saving the tasks to the JSON file in 500 ms. The delay is restarted on every change,
+        so a burst of changes results in a single write. A pending save is flushed when the page is destroyed.
 
-        :param task: The text description of the task whose completion status needs to be updated.
-        :param var: The Boolean variable (tk.BooleanVar) that holds the new completion status (True or False).
         :return: None
         """
-        for task_info in self.tasks["yearly_plans"]:
-            if task_info["task"] == task:
-                task_info["done"] = var.get()
-                break
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(500, self.flush_pending_save)
+
+    def flush_pending_save(self, event=None):
+        """
+        Saves the tasks to the JSON file if a delayed save is pending.
+
+        :param event: The <Destroy> event when called on page close, None otherwise.
+        :return: None
+        """
+        if self._save_job is None:
+            return
+
+        self.after_cancel(self._save_job)
+        self._save_job = None
         self.save_tasks_to_json()
 
-    def remove_task(self, task, frame):
+    def remove_task(self, task_id, frame):
         """
         Removes a task from the task list and deletes its corresponding widget.
 
@@ -255,17 +386,24 @@ class YearlyPlansInner(tk.Frame):
         It removes the task from the internal list of tasks, deletes the associated widget from the UI,
         and updates the task list in the JSON file.
 
-        :param task: The text description of the task to be removed.
+        :param task_id: The id of the task to be removed.
         :param frame: The frame (widget) containing the task UI element that should be removed.
         :return: None
         """
-        self.tasks["yearly_plans"] = [task_info for task_info in self.tasks["yearly_plans"] if
-                                      task_info["task"] != task]
-        self.save_tasks_to_json()
-        frame.destroy()  # Delete task widget
+        removed_task = self._task_index_by_id.pop(task_id)
+        if self._task_index.get(removed_task["task"]) is removed_task:
+            del self._task_index[removed_task["task"]]
+        self._schedule_save()
+
+        # Hide the task widget and keep it for the next added task
+        frame.pack_forget()
+        if len(self._widget_pool) < WIDGET_POOL_SIZE:
+            self._widget_pool.append(frame)
+        else:
+            frame.destroy()
 
         # Check scroll
-        self.main_window.check_scrollbar()
+        self._schedule_scrollbar_check()
 
     def add_task(self):
         """
@@ -274,24 +412,62 @@ class YearlyPlansInner(tk.Frame):
         This method is called when the user enters a task in the input field and presses the "Add Task" button
         or the "Enter" key. The new task is validated (it cannot be empty), added to the task list, and saved
         to the JSON file. The UI is updated by clearing the input field and displaying the newly added task.
-        If the input is empty, an error message is shown.
+        If the input is empty or the task already exists, an error message is shown.
 
         :return: None
         """
-        new_task = self.task_entry.get().strip()
+        new_task = self.task_entry.get()
         if new_task:
-            # Add new task to list
-            self.tasks["yearly_plans"].append({"task": new_task, "done": False})
-            self.save_tasks_to_json()
-
-            # Clear entry field
-            self.task_entry.delete(0, tk.END)
+            new_task = new_task.strip()
 
-            self.create_task_widget(new_task, False)
-            # Check scroll
-            self.main_window.check_scrollbar()
-        else:
+        # Validate before touching the task list
+        if not new_task:
             messagebox.showinfo("Error", "Task cannot be empty.")
+            return
+        if new_task in self._task_index:
+            messagebox.showinfo("Error", "Task already exists.")
+            return
+
+        # Add new task, the widget registers it in the list
+        task_info = {"task": new_task, "done": False}
+        self._task_index[new_task] = task_info
+        self.create_task_widget(task_info)
+        self._schedule_save()
+
+        # Clear entry field
+        self.task_entry.delete(0, tk.END)
+
+        # Check scroll
+        self._schedule_scrollbar_check()
+
+    @property
+    def yearly_plans(self):
+        """
+        The displayed tasks in display order.
+
+        :return: list
+        """
+        return list(self._task_index_by_id.values())
+
+    def _schedule_scrollbar_check(self):
+        """
+        Checks the scrollbar of the main window once the pending UI work is done. Several tasks added or removed
+        before that result in a single check. The check is scheduled on the main window, which outlives the page.
+
+        :return: None
+        """
+        if not self._scrollbar_check_pending:
+            self._scrollbar_check_pending = True
+            self.main_window.after_idle(self._check_scrollbar)
+
+    def _check_scrollbar(self):
+        """
+        Runs the scrollbar check scheduled by `_schedule_scrollbar_check`.
+
+        :return: None
+        """
+        self._scrollbar_check_pending = False
+        self.main_window.check_scrollbar()
 
     def save_tasks_to_json(self):
         """
@@ -299,8 +475,8 @@ class YearlyPlansInner(tk.Frame):
 
         :return: None
         """
-        with open(self.json_file, 'w', encoding='utf-8') as f:
-            json.dump(self.tasks, f, ensure_ascii=False, indent=4)
+        self.tasks["yearly_plans"] = self.yearly_plans
+        self.main_window.json_cache.save(self.json_file, self.tasks, ensure_ascii=False, separators=(',', ':'))
 
     def navigate_to_yearly_plans(self):
         """
@@ -325,8 +501,8 @@ class YearlyPlansInner(tk.Frame):
         self.main_window.bind_events()
         clear_canvas(self.parent)
 
-        from src.year import Year
-        year_frame = Year(self.parent, json_file=f"data/years/{year}.json", main_window=self.main_window, year=year)
+        year_frame = src.year.Year(self.parent, json_file=f"data/years/{year}.json", main_window=self.main_window,
+                                   year=year)
         year_frame.pack(fill=tk.BOTH, expand=True)
 
         reset_canvas_view(self.main_window)